@@ -23,7 +23,7 @@ except ImportError:
     import json  # type: ignore[no-redef]
 
 import warnings
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from telegram.utils.types import JSONDict
 
@@ -39,6 +39,9 @@ class TelegramObject:
     # def __init__(self, *args: Any, **_kwargs: Any):
     #     pass
 
+    # Empty, so that subclasses may use __slots__ without getting a __dict__ anyway
+    __slots__ = ()
+
     _id_attrs: Tuple[Any, ...] = ()
 
     def __str__(self) -> str:
@@ -47,6 +50,14 @@ class TelegramObject:
     def __getitem__(self, item: str) -> Any:
         return self.__dict__[item]
 
+    def _get_attrs(self) -> Dict[str, Any]:
+        """Returns the attributes considered by :meth:`to_dict`. Subclasses that use
+        ``__slots__`` need to override this."""
+        try:
+            return self.__dict__
+        except AttributeError:
+            return {}
+
     @staticmethod
     def parse_data(data: Optional[JSONDict]) -> Optional[JSONDict]:
         if not data:
@@ -83,11 +94,10 @@ class TelegramObject:
     def to_dict(self) -> JSONDict:
         data = dict()
 
-        for key in iter(self.__dict__):
+        for key, value in self._get_attrs().items():
             if key == 'bot' or key.startswith('_'):
                 continue
 
-            value = self.__dict__[key]
             if value is not None:
                 if hasattr(value, 'to_dict'):
                     data[key] = value.to_dict()
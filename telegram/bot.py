@@ -259,7 +259,7 @@ class Bot(TelegramObject):
             else:
                 data['reply_markup'] = reply_markup
 
-        if data.get('media') and (data['media'].parse_mode == DEFAULT_NONE):
+        if data.get('media') and (data['media'].parse_mode is DEFAULT_NONE):
             if self.defaults:
                 data['media'].parse_mode = self.defaults.parse_mode
             else:
@@ -1279,7 +1279,7 @@ class Bot(TelegramObject):
         data: JSONDict = {'chat_id': chat_id, 'media': media}
 
         for m in data['media']:
-            if m.parse_mode == DEFAULT_NONE:
+            if m.parse_mode is DEFAULT_NONE:
                 if self.defaults:
                     m.parse_mode = self.defaults.parse_mode
                 else:
@@ -18,11 +18,36 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """Base class for Telegram InputMedia Objects."""
 
-from typing import IO, Union, cast
+from typing import (
+    IO,
+    Any,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from telegram import Animation, Audio, Document, InputFile, PhotoSize, TelegramObject, Video
 from telegram.utils.helpers import DEFAULT_NONE, DefaultValue
-from telegram.utils.types import FileLike
+from telegram.utils.types import FileLike, JSONDict
+
+_is_file = InputFile.is_file
+
+IM = TypeVar('IM', bound='InputMedia')
+
+
+def _resolve_thumb(thumb: Any) -> Optional[Union[str, InputFile]]:
+    """Wraps the ``thumb`` argument of the InputMedia classes in a :class:`telegram.InputFile`,
+    if it's a file."""
+    if type(thumb) is str or isinstance(thumb, InputFile):  # pylint: disable=C0123
+        return thumb
+    if _is_file(thumb):
+        return InputFile(cast(IO, thumb), attach=True)
+    return thumb
 
 
 class InputMedia(TelegramObject):
@@ -34,6 +59,105 @@ class InputMedia(TelegramObject):
 
     """
 
+    __slots__ = ('media',)
+
+    type: ClassVar[str]
+    _NATIVE_TYPE: ClassVar[Type[TelegramObject]]
+    # The attributes to include in to_dict, in the order in which they are serialized. Set for
+    # each subclass in __init_subclass__
+    _FIELDS: ClassVar[Tuple[str, ...]] = ('type', 'media')
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._FIELDS = ('type',) + tuple(
+            slot for klass in reversed(cls.__mro__) for slot in klass.__dict__.get('__slots__', ())
+        )
+
+    def __getitem__(self, item: str) -> Any:
+        return self._get_attrs()[item]
+
+    def _get_attrs(self) -> Dict[str, Any]:
+        attrs = {key: getattr(self, key, None) for key in self._FIELDS}
+        attrs.update(super()._get_attrs())
+        return attrs
+
+    def _resolve(self, media: Any) -> Optional[Any]:
+        """Sets :attr:`media` from the ``media`` argument of the subclasses.
+
+        Returns:
+            The passed telegram object, if ``media`` is an instance of :attr:`_NATIVE_TYPE`,
+            :obj:`None` otherwise.
+
+        """
+        # pylint: disable=W0201
+        # file_ids and URLs are by far the most common input and are always plain strings
+        if type(media) is str:  # pylint: disable=C0123
+            self.media: Union[str, InputFile] = media
+            return None
+        if isinstance(media, InputFile):
+            self.media = media
+            return None
+        if isinstance(media, self._NATIVE_TYPE):
+            self.media = media.file_id  # type: ignore[attr-defined]
+            return media
+        if _is_file(media):
+            self.media = InputFile(cast(IO, media), attach=True)
+        else:
+            self.media = media
+        return None
+
+    @classmethod
+    def _from_file_id(cls: Type[IM], file_id: str, **kwargs: Any) -> IM:
+        """Shared implementation of the ``from_file_id`` methods of the subclasses. Attributes
+        that are not passed are set to :obj:`None`."""
+        if cls.__module__ != __name__:
+            # Subclasses defined elsewhere may rely on their own __init__ being called
+            return cls(file_id, **kwargs)  # type: ignore[call-arg]
+
+        # pylint: disable=W0201
+        obj = cls.__new__(cls)
+        obj.media = file_id
+        for key in cls._FIELDS[2:]:
+            setattr(obj, key, kwargs.get(key))
+        return obj
+
+    def to_dict(self) -> JSONDict:
+        if hasattr(self, '__dict__'):
+            # Subclasses without __slots__ may have attributes that are not in _FIELDS
+            return super().to_dict()
+
+        data = dict()
+
+        for key in self._FIELDS:
+            value = getattr(self, key, None)
+            if value is not None:
+                data[key] = value.to_dict() if isinstance(value, InputFile) else value
+
+        return data
+
+    @staticmethod
+    def from_native(obj: TelegramObject, **kwargs: Any) -> 'InputMedia':
+        """Creates the matching InputMedia object for a :class:`telegram.Animation`,
+        :class:`telegram.Audio`, :class:`telegram.Document`, :class:`telegram.PhotoSize` or
+        :class:`telegram.Video`.
+
+        Args:
+            obj (:class:`telegram.TelegramObject`): The object to send.
+            **kwargs (:obj:`dict`): Arbitrary keyword arguments passed to the constructor of the
+                InputMedia class.
+
+        Returns:
+            :class:`telegram.InputMedia`
+
+        Raises:
+            :class:`TypeError`: If there is no InputMedia class for the type of :attr:`obj`.
+
+        """
+        cls = _TYPE_MAP.get(type(obj))
+        if cls is None:
+            raise TypeError('Can not create InputMedia for {}'.format(type(obj).__name__))
+        return cls(obj, **kwargs)  # type: ignore[call-arg]
+
 
 class InputMediaAnimation(InputMedia):
     """Represents an animation file (GIF or H.264/MPEG-4 AVC video without sound) to be sent.
@@ -74,6 +198,11 @@ class InputMediaAnimation(InputMedia):
         arguments.
     """
 
+    __slots__ = ('thumb', 'caption', 'parse_mode', 'width', 'height', 'duration')
+
+    type: ClassVar[str] = 'animation'
+    _NATIVE_TYPE = Animation
+
     def __init__(
         self,
         media: Union[str, FileLike, Animation],
@@ -84,35 +213,47 @@ class InputMediaAnimation(InputMedia):
         height: int = None,
         duration: int = None,
     ):
-        self.type = 'animation'
-
-        if isinstance(media, Animation):
-            self.media: Union[str, InputFile] = media.file_id
-            self.width = media.width
-            self.height = media.height
-            self.duration = media.duration
-        elif InputFile.is_file(media):
-            media = cast(IO, media)
-            self.media = InputFile(media, attach=True)
-        else:
-            self.media = media  # type: ignore[assignment]
+        native = self._resolve(media)
+        if native is not None:
+            width = native.width if width is None else width
+            height = native.height if height is None else height
+            duration = native.duration if duration is None else duration
+        self.thumb = _resolve_thumb(thumb)
+        self.caption = caption
+        self.parse_mode = parse_mode
+        self.width = width
+        self.height = height
+        self.duration = duration
+
+    @classmethod
+    def from_file_id(
+        cls,
+        file_id: str,
+        caption: str = None,
+        parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
+        width: int = None,
+        height: int = None,
+        duration: int = None,
+    ) -> 'InputMediaAnimation':
+        """Creates an instance for an animation stored on the Telegram servers. Unlike the
+        constructor, this doesn't check which kind of ``media`` was passed. The remaining
+        arguments are the same as for the constructor.
 
-        if thumb:
-            if InputFile.is_file(thumb):
-                thumb = cast(IO, thumb)
-                self.thumb = InputFile(thumb, attach=True)
-            else:
-                self.thumb = thumb  # type: ignore[assignment]
+        Args:
+            file_id (:obj:`str`): The file_id of the file to send.
 
-        if caption:
-            self.caption = caption
-        self.parse_mode = parse_mode
-        if width:
-            self.width = width
-        if height:
-            self.height = height
-        if duration:
-            self.duration = duration
+        Returns:
+            :class:`telegram.InputMediaAnimation`
+
+        """
+        return cls._from_file_id(
+            file_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            width=width,
+            height=height,
+            duration=duration,
+        )
 
 
 class InputMediaPhoto(InputMedia):
@@ -136,25 +277,40 @@ class InputMediaPhoto(InputMedia):
             in :class:`telegram.ParseMode` for the available modes.
     """
 
+    __slots__ = ('caption', 'parse_mode')
+
+    type: ClassVar[str] = 'photo'
+    _NATIVE_TYPE = PhotoSize
+
     def __init__(
         self,
         media: Union[str, FileLike, PhotoSize],
         caption: str = None,
         parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
     ):
-        self.type = 'photo'
+        self._resolve(media)
+        self.caption = caption
+        self.parse_mode = parse_mode
 
-        if isinstance(media, PhotoSize):
-            self.media: Union[str, InputFile] = media.file_id
-        elif InputFile.is_file(media):
-            media = cast(IO, media)
-            self.media = InputFile(media, attach=True)
-        else:
-            self.media = media  # type: ignore[assignment]
+    @classmethod
+    def from_file_id(
+        cls,
+        file_id: str,
+        caption: str = None,
+        parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
+    ) -> 'InputMediaPhoto':
+        """Creates an instance for a photo stored on the Telegram servers. Unlike the
+        constructor, this doesn't check which kind of ``media`` was passed. The remaining
+        arguments are the same as for the constructor.
 
-        if caption:
-            self.caption = caption
-        self.parse_mode = parse_mode
+        Args:
+            file_id (:obj:`str`): The file_id of the file to send.
+
+        Returns:
+            :class:`telegram.InputMediaPhoto`
+
+        """
+        return cls._from_file_id(file_id, caption=caption, parse_mode=parse_mode)
 
 
 class InputMediaVideo(InputMedia):
@@ -202,6 +358,19 @@ class InputMediaVideo(InputMedia):
            by Telegram.
     """
 
+    __slots__ = (
+        'caption',
+        'width',
+        'height',
+        'duration',
+        'supports_streaming',
+        'parse_mode',
+        'thumb',
+    )
+
+    type: ClassVar[str] = 'video'
+    _NATIVE_TYPE = Video
+
     def __init__(
         self,
         media: Union[str, FileLike, Video],
@@ -213,37 +382,50 @@ class InputMediaVideo(InputMedia):
         parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
         thumb: FileLike = None,
     ):
-        self.type = 'video'
-
-        if isinstance(media, Video):
-            self.media: Union[str, InputFile] = media.file_id
-            self.width = media.width
-            self.height = media.height
-            self.duration = media.duration
-        elif InputFile.is_file(media):
-            media = cast(IO, media)
-            self.media = InputFile(media, attach=True)
-        else:
-            self.media = media  # type: ignore[assignment]
+        native = self._resolve(media)
+        if native is not None:
+            width = native.width if width is None else width
+            height = native.height if height is None else height
+            duration = native.duration if duration is None else duration
+        self.thumb = _resolve_thumb(thumb)
+        self.caption = caption
+        self.parse_mode = parse_mode
+        self.width = width
+        self.height = height
+        self.duration = duration
+        self.supports_streaming = supports_streaming
+
+    @classmethod
+    def from_file_id(
+        cls,
+        file_id: str,
+        caption: str = None,
+        width: int = None,
+        height: int = None,
+        duration: int = None,
+        supports_streaming: bool = None,
+        parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
+    ) -> 'InputMediaVideo':
+        """Creates an instance for a video stored on the Telegram servers. Unlike the
+        constructor, this doesn't check which kind of ``media`` was passed. The remaining
+        arguments are the same as for the constructor.
 
-        if thumb:
-            if InputFile.is_file(thumb):
-                thumb = cast(IO, thumb)
-                self.thumb = InputFile(thumb, attach=True)
-            else:
-                self.thumb = thumb  # type: ignore[assignment]
+        Args:
+            file_id (:obj:`str`): The file_id of the file to send.
 
-        if caption:
-            self.caption = caption
-        self.parse_mode = parse_mode
-        if width:
-            self.width = width
-        if height:
-            self.height = height
-        if duration:
-            self.duration = duration
-        if supports_streaming:
-            self.supports_streaming = supports_streaming
+        Returns:
+            :class:`telegram.InputMediaVideo`
+
+        """
+        return cls._from_file_id(
+            file_id,
+            caption=caption,
+            width=width,
+            height=height,
+            duration=duration,
+            supports_streaming=supports_streaming,
+            parse_mode=parse_mode,
+        )
 
 
 class InputMediaAudio(InputMedia):
@@ -286,6 +468,11 @@ class InputMediaAudio(InputMedia):
         optional arguments.
     """
 
+    __slots__ = ('thumb', 'caption', 'parse_mode', 'duration', 'performer', 'title')
+
+    type: ClassVar[str] = 'audio'
+    _NATIVE_TYPE = Audio
+
     def __init__(
         self,
         media: Union[str, FileLike, Audio],
@@ -296,35 +483,47 @@ class InputMediaAudio(InputMedia):
         performer: str = None,
         title: str = None,
     ):
-        self.type = 'audio'
-
-        if isinstance(media, Audio):
-            self.media: Union[str, InputFile] = media.file_id
-            self.duration = media.duration
-            self.performer = media.performer
-            self.title = media.title
-        elif InputFile.is_file(media):
-            media = cast(IO, media)
-            self.media = InputFile(media, attach=True)
-        else:
-            self.media = media  # type: ignore[assignment]
+        native = self._resolve(media)
+        if native is not None:
+            duration = native.duration if duration is None else duration
+            performer = native.performer if performer is None else performer
+            title = native.title if title is None else title
+        self.thumb = _resolve_thumb(thumb)
+        self.caption = caption
+        self.parse_mode = parse_mode
+        self.duration = duration
+        self.performer = performer
+        self.title = title
+
+    @classmethod
+    def from_file_id(
+        cls,
+        file_id: str,
+        caption: str = None,
+        parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
+        duration: int = None,
+        performer: str = None,
+        title: str = None,
+    ) -> 'InputMediaAudio':
+        """Creates an instance for an audio file stored on the Telegram servers. Unlike the
+        constructor, this doesn't check which kind of ``media`` was passed. The remaining
+        arguments are the same as for the constructor.
 
-        if thumb:
-            if InputFile.is_file(thumb):
-                thumb = cast(IO, thumb)
-                self.thumb = InputFile(thumb, attach=True)
-            else:
-                self.thumb = thumb  # type: ignore[assignment]
+        Args:
+            file_id (:obj:`str`): The file_id of the file to send.
 
-        if caption:
-            self.caption = caption
-        self.parse_mode = parse_mode
-        if duration:
-            self.duration = duration
-        if performer:
-            self.performer = performer
-        if title:
-            self.title = title
+        Returns:
+            :class:`telegram.InputMediaAudio`
+
+        """
+        return cls._from_file_id(
+            file_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            duration=duration,
+            performer=performer,
+            title=title,
+        )
 
 
 class InputMediaDocument(InputMedia):
@@ -354,6 +553,11 @@ class InputMediaDocument(InputMedia):
             Thumbnails can't be reused and can be only uploaded as a new file.
     """
 
+    __slots__ = ('thumb', 'caption', 'parse_mode')
+
+    type: ClassVar[str] = 'document'
+    _NATIVE_TYPE = Document
+
     def __init__(
         self,
         media: Union[str, FileLike, Document],
@@ -361,23 +565,36 @@ class InputMediaDocument(InputMedia):
         caption: str = None,
         parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
     ):
-        self.type = 'document'
+        self._resolve(media)
+        self.thumb = _resolve_thumb(thumb)
+        self.caption = caption
+        self.parse_mode = parse_mode
 
-        if isinstance(media, Document):
-            self.media: Union[str, InputFile] = media.file_id
-        elif InputFile.is_file(media):
-            media = cast(IO, media)
-            self.media = InputFile(media, attach=True)
-        else:
-            self.media = media  # type: ignore[assignment]
+    @classmethod
+    def from_file_id(
+        cls,
+        file_id: str,
+        caption: str = None,
+        parse_mode: Union[str, DefaultValue] = DEFAULT_NONE,
+    ) -> 'InputMediaDocument':
+        """Creates an instance for a file stored on the Telegram servers. Unlike the
+        constructor, this doesn't check which kind of ``media`` was passed. The remaining
+        arguments are the same as for the constructor.
 
-        if thumb:
-            if InputFile.is_file(thumb):
-                thumb = cast(IO, thumb)
-                self.thumb = InputFile(thumb, attach=True)
-            else:
-                self.thumb = thumb  # type: ignore[assignment]
+        Args:
+            file_id (:obj:`str`): The file_id of the file to send.
 
-        if caption:
-            self.caption = caption
-        self.parse_mode = parse_mode
+        Returns:
+            :class:`telegram.InputMediaDocument`
+
+        """
+        return cls._from_file_id(file_id, caption=caption, parse_mode=parse_mode)
+
+
+_TYPE_MAP: Dict[type, Type[InputMedia]] = {
+    Animation: InputMediaAnimation,
+    Audio: InputMediaAudio,
+    Document: InputMediaDocument,
+    PhotoSize: InputMediaPhoto,
+    Video: InputMediaVideo,
+}
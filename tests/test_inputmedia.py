@@ -20,6 +20,7 @@ import pytest
 from flaky import flaky
 
 from telegram import (
+    InputMedia,
     InputMediaVideo,
     InputMediaPhoto,
     InputMediaAnimation,
@@ -27,7 +28,10 @@ from telegram import (
     InputFile,
     InputMediaAudio,
     InputMediaDocument,
+    TelegramObject,
+    Video,
 )
+from telegram.utils.helpers import DEFAULT_NONE
 
 # noinspection PyUnresolvedReferences
 from .test_animation import animation, animation_file  # noqa: F401
@@ -126,6 +130,12 @@ class TestInputMediaVideo:
         assert input_media_video.supports_streaming == self.supports_streaming
         assert isinstance(input_media_video.thumb, InputFile)
 
+    def test_slot_behaviour(self, input_media_video):
+        inst = input_media_video
+        assert not hasattr(inst, '__dict__')
+        for attr in inst.__slots__:
+            getattr(inst, attr)
+
     def test_to_dict(self, input_media_video):
         input_media_video_dict = input_media_video.to_dict()
         assert input_media_video_dict['type'] == input_media_video.type
@@ -137,6 +147,21 @@ class TestInputMediaVideo:
         assert input_media_video_dict['parse_mode'] == input_media_video.parse_mode
         assert input_media_video_dict['supports_streaming'] == input_media_video.supports_streaming
 
+    def test_to_dict_matches_generic(self, input_media_video):
+        assert input_media_video.to_dict() == TelegramObject.to_dict(input_media_video)
+
+    def test_type_is_read_only(self, input_media_video):
+        # type is a class attribute shared by all instances and can't be set per instance
+        assert InputMediaVideo.type == self.type_
+        with pytest.raises(AttributeError):
+            input_media_video.type = 'photo'
+        assert input_media_video.type == self.type_
+
+    def test_getitem(self, input_media_video):
+        assert input_media_video['type'] == self.type_
+        assert input_media_video['media'] == self.media
+        assert input_media_video['width'] == self.width
+
     def test_with_video(self, video):  # noqa: F811
         # fixture found in test_video
         input_media_video = InputMediaVideo(video, caption="test 3")
@@ -154,6 +179,50 @@ class TestInputMediaVideo:
         assert isinstance(input_media_video.media, InputFile)
         assert input_media_video.caption == "test 3"
 
+    def test_from_file_id(self):
+        input_media_video = InputMediaVideo.from_file_id(
+            self.media,
+            caption=self.caption,
+            width=self.width,
+            height=self.height,
+            duration=self.duration,
+            supports_streaming=self.supports_streaming,
+            parse_mode=self.parse_mode,
+        )
+        expected = InputMediaVideo(
+            self.media,
+            caption=self.caption,
+            width=self.width,
+            height=self.height,
+            duration=self.duration,
+            supports_streaming=self.supports_streaming,
+            parse_mode=self.parse_mode,
+        )
+        assert input_media_video.to_dict() == expected.to_dict()
+        assert input_media_video.thumb is None
+
+    def test_from_native(self):
+        native_video = Video('file_id', 'unique_id', 1, 2, 3)
+        input_media_video = InputMedia.from_native(native_video, caption="test 3")
+        assert isinstance(input_media_video, InputMediaVideo)
+        assert input_media_video.media == native_video.file_id
+        assert input_media_video.width == native_video.width
+        assert input_media_video.caption == "test 3"
+
+        with pytest.raises(TypeError, match='InputMediaVideo'):
+            InputMedia.from_native(input_media_video)
+
+    def test_falsy_values(self):
+        input_media_video = InputMediaVideo(
+            self.media, caption='', width=0, height=0, duration=0, supports_streaming=False
+        )
+        input_media_video_dict = input_media_video.to_dict()
+        assert input_media_video_dict['caption'] == ''
+        assert input_media_video_dict['width'] == 0
+        assert input_media_video_dict['height'] == 0
+        assert input_media_video_dict['duration'] == 0
+        assert input_media_video_dict['supports_streaming'] is False
+
 
 class TestInputMediaPhoto:
     type_ = "photo"
@@ -167,6 +236,12 @@ class TestInputMediaPhoto:
         assert input_media_photo.caption == self.caption
         assert input_media_photo.parse_mode == self.parse_mode
 
+    def test_slot_behaviour(self, input_media_photo):
+        inst = input_media_photo
+        assert not hasattr(inst, '__dict__')
+        for attr in inst.__slots__:
+            getattr(inst, attr)
+
     def test_to_dict(self, input_media_photo):
         input_media_photo_dict = input_media_photo.to_dict()
         assert input_media_photo_dict['type'] == input_media_photo.type
@@ -174,6 +249,24 @@ class TestInputMediaPhoto:
         assert input_media_photo_dict['caption'] == input_media_photo.caption
         assert input_media_photo_dict['parse_mode'] == input_media_photo.parse_mode
 
+    def test_to_dict_subclass(self):
+        class SlottedSubclass(InputMediaPhoto):
+            __slots__ = ('extra',)
+
+            def __init__(self, media):
+                super().__init__(media)
+                self.extra = 'extra'
+
+        class Subclass(InputMediaPhoto):
+            def __init__(self, media):
+                super().__init__(media)
+                self.extra = 'extra'
+
+        assert SlottedSubclass._FIELDS[-1] == 'extra'
+        assert SlottedSubclass(self.media).to_dict()['extra'] == 'extra'
+        assert Subclass(self.media).to_dict()['extra'] == 'extra'
+        assert InputMedia().to_dict() == {}
+
     def test_with_photo(self, photo):  # noqa: F811
         # fixture found in test_photo
         input_media_photo = InputMediaPhoto(photo, caption="test 2")
@@ -188,6 +281,32 @@ class TestInputMediaPhoto:
         assert isinstance(input_media_photo.media, InputFile)
         assert input_media_photo.caption == "test 2"
 
+    def test_with_input_file(self, photo_file):  # noqa: F811
+        # fixture found in test_photo
+        media = InputFile(photo_file, attach=True)
+        input_media_photo = InputMediaPhoto(media, caption="test 2")
+        assert input_media_photo.media is media
+        assert input_media_photo.to_dict()['media'] == media.to_dict()
+
+    def test_from_file_id(self):
+        input_media_photo = InputMediaPhoto.from_file_id(self.media, caption=self.caption)
+        assert input_media_photo.type == self.type_
+        assert input_media_photo.media == self.media
+        assert input_media_photo.caption == self.caption
+        assert input_media_photo.parse_mode is DEFAULT_NONE
+
+    def test_from_file_id_subclass(self):
+        class CustomInputMediaPhoto(InputMediaPhoto):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.custom = True
+
+        input_media_photo = CustomInputMediaPhoto.from_file_id(self.media, caption=self.caption)
+        assert isinstance(input_media_photo, CustomInputMediaPhoto)
+        assert input_media_photo.custom
+        assert input_media_photo.media == self.media
+        assert input_media_photo.caption == self.caption
+
 
 class TestInputMediaAnimation:
     type_ = "animation"
@@ -205,6 +324,12 @@ class TestInputMediaAnimation:
         assert input_media_animation.parse_mode == self.parse_mode
         assert isinstance(input_media_animation.thumb, InputFile)
 
+    def test_slot_behaviour(self, input_media_animation):
+        inst = input_media_animation
+        assert not hasattr(inst, '__dict__')
+        for attr in inst.__slots__:
+            getattr(inst, attr)
+
     def test_to_dict(self, input_media_animation):
         input_media_animation_dict = input_media_animation.to_dict()
         assert input_media_animation_dict['type'] == input_media_animation.type
@@ -229,6 +354,27 @@ class TestInputMediaAnimation:
         assert isinstance(input_media_animation.media, InputFile)
         assert input_media_animation.caption == "test 2"
 
+    def test_from_file_id(self):
+        input_media_animation = InputMediaAnimation.from_file_id(
+            self.media,
+            caption=self.caption,
+            parse_mode=self.parse_mode,
+            width=self.width,
+            height=self.height,
+            duration=self.duration,
+        )
+        expected = InputMediaAnimation(
+            self.media,
+            caption=self.caption,
+            parse_mode=self.parse_mode,
+            width=self.width,
+            height=self.height,
+            duration=self.duration,
+        )
+        assert input_media_animation.to_dict() == expected.to_dict()
+        for attr in input_media_animation.__slots__:
+            getattr(input_media_animation, attr)
+
 
 class TestInputMediaAudio:
     type_ = "audio"
@@ -249,6 +395,12 @@ class TestInputMediaAudio:
         assert input_media_audio.parse_mode == self.parse_mode
         assert isinstance(input_media_audio.thumb, InputFile)
 
+    def test_slot_behaviour(self, input_media_audio):
+        inst = input_media_audio
+        assert not hasattr(inst, '__dict__')
+        for attr in inst.__slots__:
+            getattr(inst, attr)
+
     def test_to_dict(self, input_media_audio):
         input_media_audio_dict = input_media_audio.to_dict()
         assert input_media_audio_dict['type'] == input_media_audio.type
@@ -276,6 +428,27 @@ class TestInputMediaAudio:
         assert isinstance(input_media_audio.media, InputFile)
         assert input_media_audio.caption == "test 3"
 
+    def test_from_file_id(self):
+        input_media_audio = InputMediaAudio.from_file_id(
+            self.media,
+            caption=self.caption,
+            parse_mode=self.parse_mode,
+            duration=self.duration,
+            performer=self.performer,
+            title=self.title,
+        )
+        expected = InputMediaAudio(
+            self.media,
+            caption=self.caption,
+            parse_mode=self.parse_mode,
+            duration=self.duration,
+            performer=self.performer,
+            title=self.title,
+        )
+        assert input_media_audio.to_dict() == expected.to_dict()
+        for attr in input_media_audio.__slots__:
+            getattr(input_media_audio, attr)
+
 
 class TestInputMediaDocument:
     type_ = "document"
@@ -290,6 +463,12 @@ class TestInputMediaDocument:
         assert input_media_document.parse_mode == self.parse_mode
         assert isinstance(input_media_document.thumb, InputFile)
 
+    def test_slot_behaviour(self, input_media_document):
+        inst = input_media_document
+        assert not hasattr(inst, '__dict__')
+        for attr in inst.__slots__:
+            getattr(inst, attr)
+
     def test_to_dict(self, input_media_document):
         input_media_document_dict = input_media_document.to_dict()
         assert input_media_document_dict['type'] == input_media_document.type
@@ -311,6 +490,23 @@ class TestInputMediaDocument:
         assert isinstance(input_media_document.media, InputFile)
         assert input_media_document.caption == "test 3"
 
+    def test_with_input_file(self, document_file, class_thumb_file):  # noqa: F811
+        # fixture found in test_document
+        media = InputFile(document_file, attach=True)
+        input_thumb = InputFile(class_thumb_file, attach=True)
+        input_media_document = InputMediaDocument(media, thumb=input_thumb)
+        assert input_media_document.media is media
+        assert input_media_document.thumb is input_thumb
+
+    def test_from_file_id(self):
+        input_media_document = InputMediaDocument.from_file_id(
+            self.media, caption=self.caption, parse_mode=self.parse_mode
+        )
+        expected = InputMediaDocument(self.media, caption=self.caption, parse_mode=self.parse_mode)
+        assert input_media_document.to_dict() == expected.to_dict()
+        for attr in input_media_document.__slots__:
+            getattr(input_media_document, attr)
+
 
 @pytest.fixture(scope='function')  # noqa: F811
 def media_group(photo, thumb):  # noqa: F811